@@ -1,12 +1,13 @@
 import streamlit as st
 import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-import matplotlib
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-from dataclasses import dataclass
 from typing import List, Tuple
 
+from core import Makanan, greedy_iteratif, greedy_rekursif, load_menu_from_csv
+
 # =========================
 # PAGE CONFIG (HARUS PALING ATAS)
 # =========================
@@ -19,7 +20,9 @@ st.set_page_config(
 # =========================
 # THEME (OPSIONAL - pastel)
 # =========================
-st.markdown("""
+# Tetap di-inject tiap rerun: elemen yang tidak ditulis ulang akan dihapus Streamlit,
+# jadi guard session_state justru menghilangkan tema setelah interaksi pertama.
+THEME_CSS = """
 <style>
 .stApp { background: #FCF8F8; }
 section[data-testid="stSidebar"] { background: #FBEFEF; border-right: 1px solid #F9DFDF; }
@@ -34,90 +37,68 @@ div.stButton > button {
 }
 div.stButton > button:hover { background:#f39e9e !important; transform: translateY(-1px); }
 </style>
-""", unsafe_allow_html=True)
+"""
 
-# =========================
-# DATA MODEL
-# =========================
-@dataclass(frozen=True)
-class Makanan:
-    nama: str
-    kalori: int
-
-# =========================
-# DATA LOADING
-# =========================
-@st.cache_data(show_spinner=False)
-def load_menu_from_csv(csv_path: str) -> List[Makanan]:
-    df = pd.read_csv(csv_path)
-
-    required_cols = {"Nama_Makanan", "Kalori_kcal"}
-    if not required_cols.issubset(df.columns):
-        raise ValueError(f"Kolom CSV harus ada: {required_cols}. Kolom ditemukan: {set(df.columns)}")
-
-    df["Kalori_kcal"] = pd.to_numeric(df["Kalori_kcal"], errors="coerce")
-    df = df.dropna(subset=["Kalori_kcal", "Nama_Makanan"])
-
-    menu = [Makanan(str(r["Nama_Makanan"]), int(r["Kalori_kcal"])) for _, r in df.iterrows()]
-    if not menu:
-        raise ValueError("Data menu kosong setelah validasi. Cek isi CSV kamu.")
-    return menu
-
-# =========================
-# GREEDY: CLOSEST FIRST
-# =========================
-def greedy_iteratif(target: int, menu: List[Makanan]) -> List[Makanan]:
-    hasil = []
-    sisa = target
-
-    while sisa > 0:
-        pilih = min(menu, key=lambda m: abs(m.kalori - sisa))
-        hasil.append(pilih)
-        sisa -= pilih.kalori
-
-    return hasil
-
-def greedy_rekursif(sisa: int, menu: List[Makanan], hasil: List[Makanan]) -> None:
-    if sisa <= 0:
-        return
-
-    pilih = min(menu, key=lambda m: abs(m.kalori - sisa))
-    hasil.append(pilih)
-    greedy_rekursif(sisa - pilih.kalori, menu, hasil)
+st.markdown(THEME_CSS, unsafe_allow_html=True)
 
 # =========================
 # TIMING UTILITIES
 # =========================
-def measure_time_iteratif(target: int, menu: List[Makanan], trials: int = 5) -> Tuple[List[Makanan], float]:
-    times = []
-    result = []
+TIMEIT_NUMBER = 50  # eksekusi per trial; waktu per eksekusi = min(trial) / TIMEIT_NUMBER
+
+def _best_time_us(fn, trials: int) -> float:
+    timer = timeit.Timer(fn, timer=time.perf_counter_ns)
+    times = np.empty(trials, dtype=np.int64)  # ns, integer
+    for k in range(trials):
+        times[k] = timer.timeit(TIMEIT_NUMBER)
+    return float(times.min()) / TIMEIT_NUMBER / 1_000  # µs
 
-    for _ in range(trials):
-        start = time.perf_counter()
-        result = greedy_iteratif(target, menu)
-        end = time.perf_counter()
-        times.append((end - start) * 1_000_000)  # µs
+def measure_time_iteratif(
+    target: int, menu: List[Makanan], kal_sorted: np.ndarray, urutan: np.ndarray, trials: int = 5
+) -> Tuple[List[Makanan], int, float]:
+    t = _best_time_us(lambda: greedy_iteratif(target, menu, kal_sorted, urutan), trials)
+    result, total = greedy_iteratif(target, menu, kal_sorted, urutan)
 
-    return result, sum(times) / len(times)
+    return result, total, t
 
-def measure_time_rekursif(target: int, menu: List[Makanan], trials: int = 5) -> Tuple[List[Makanan], float]:
-    times = []
+def measure_time_rekursif(
+    target: int, menu: List[Makanan], kal_sorted: np.ndarray, urutan: np.ndarray, trials: int = 5
+) -> Tuple[List[Makanan], int, float]:
+    t = _best_time_us(lambda: greedy_rekursif(target, menu, kal_sorted, urutan, []), trials)
     result = []
+    total = greedy_rekursif(target, menu, kal_sorted, urutan, result)
 
-    for _ in range(trials):
-        start = time.perf_counter()
-        result = []
-        greedy_rekursif(target, menu, result)
-        end = time.perf_counter()
-        times.append((end - start) * 1_000_000)  # µs
+    return result, total, t
 
-    return result, sum(times) / len(times)
+@st.cache_data(show_spinner=False)
+def solve(
+    csv_path: str,
+    target: int,
+    trials: int,
+    run_recursive: bool,
+    kalori_bytes: bytes,
+    _menu: List[Makanan],
+    _kal_sorted: np.ndarray,
+    _urutan: np.ndarray,
+) -> Tuple[List[Makanan], int, float, List[Makanan], int, float]:
+    # key cache: path + isi kalori (bytes) + target + trials + mode; argumen _* tidak di-hash
+    if run_recursive:
+        # dua varian diukur paralel; waktu = min(trial) sehingga tetap stabil
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            f_iter = ex.submit(measure_time_iteratif, target, _menu, _kal_sorted, _urutan, trials)
+            f_rec = ex.submit(measure_time_rekursif, target, _menu, _kal_sorted, _urutan, trials)
+            hasil_iter, total_i, t_iter = f_iter.result()
+            hasil_rec, total_r, t_rec = f_rec.result()
+    else:
+        hasil_iter, total_i, t_iter = measure_time_iteratif(target, _menu, _kal_sorted, _urutan, trials=trials)
+        # algoritma identik -> hasil pasti sama; lewati pengukuran kedua
+        hasil_rec, total_r, t_rec = hasil_iter, total_i, t_iter
+    return hasil_iter, total_i, t_iter, hasil_rec, total_r, t_rec
 
 def hasil_to_df(items: List[Makanan]) -> pd.DataFrame:
-    return pd.DataFrame([{"Menu": m.nama, "Kalori (kkal)": m.kalori} for m in items])
+    return pd.DataFrame({"Menu": [m.nama for m in items], "Kalori (kkal)": [m.kalori for m in items]})
 
-def summarize(target: int, items: List[Makanan]) -> Tuple[int, int, str]:
-    total = sum(m.kalori for m in items)
+def summarize(target: int, total: int) -> Tuple[int, str]:
     diff = total - target
     if diff == 0:
         status = "Tepat"
@@ -125,7 +106,7 @@ def summarize(target: int, items: List[Makanan]) -> Tuple[int, int, str]:
         status = f"Terlampaui (+{diff})"
     else:
         status = f"Kurang ({diff})"
-    return total, diff, status
+    return diff, status
 
 # =========================
 # SIDEBAR CONTROLS
@@ -133,15 +114,19 @@ def summarize(target: int, items: List[Makanan]) -> Tuple[int, int, str]:
 st.sidebar.title("⚙️ Pengaturan")
 csv_file = st.sidebar.text_input("File CSV", value="1000_data_makanan_kalori.csv")
 target = st.sidebar.slider("Target Kalori (kkal)", 50, 3000, 650, 50)
-trials = st.sidebar.slider("Trials (rata-rata waktu)", 1, 30, 5, 1)
+trials = st.sidebar.slider("Trials (waktu terbaik)", 1, 30, 5, 1)
 show_preview = st.sidebar.checkbox("Preview 10 baris CSV", value=False)
 show_chart = st.sidebar.checkbox("Tampilkan grafik waktu", value=True)
+run_recursive = st.sidebar.checkbox("Bandingkan rekursif", value=False)
+if st.sidebar.button("🔄 Ukur ulang waktu"):
+    solve.clear()
 
 # =========================
 # LOAD DATA
 # =========================
 try:
-    MENU = load_menu_from_csv(csv_file)
+    MENU, KALORI, KAL_SORTED, URUTAN = load_menu_from_csv(csv_file)
+    KALORI_BYTES = KALORI.tobytes()
 except Exception as e:
     st.error(f"Gagal membaca CSV: {e}")
     st.stop()
@@ -154,7 +139,7 @@ st.caption(f"Dataset: **{len(MENU)}** menu • Target: **{target} kkal** • Tri
 
 if show_preview:
     st.subheader("🧾 Preview Data CSV (10 baris)")
-    st.dataframe(pd.read_csv(csv_file).head(10), width="stretch", height=280)
+    st.dataframe(pd.read_csv(csv_file, nrows=10), width="stretch", height=280)
 
 st.markdown("---")
 
@@ -162,11 +147,12 @@ st.markdown("---")
 # AUTO-RUN RESULTS (MINIM SCROLL)
 # =========================
 with st.spinner("Menyusun rekomendasi menu..."):
-    hasil_iter, t_iter = measure_time_iteratif(target, MENU, trials=trials)
-    hasil_rec, t_rec = measure_time_rekursif(target, MENU, trials=trials)
+    hasil_iter, total_i, t_iter, hasil_rec, total_r, t_rec = solve(
+        csv_file, target, trials, run_recursive, KALORI_BYTES, MENU, KAL_SORTED, URUTAN
+    )
 
-total_i, diff_i, status_i = summarize(target, hasil_iter)
-total_r, diff_r, status_r = summarize(target, hasil_rec)
+diff_i, status_i = summarize(target, total_i)
+diff_r, status_r = summarize(target, total_r)
 
 colL, colR = st.columns(2, gap="large")
 
@@ -181,6 +167,8 @@ with colL:
 
 with colR:
     st.subheader("🔁 Rekursif")
+    if not run_recursive:
+        st.caption("Tidak diukur — aktifkan *Bandingkan rekursif* di sidebar. Nilai di bawah = iteratif.")
     a, b, c = st.columns(3)
     a.metric("Total", f"{total_r} kkal")
     b.metric("Item", f"{len(hasil_rec)}")
@@ -199,13 +187,10 @@ c3.metric("Selisih waktu", f"{abs(t_iter - t_rec):.2f} µs")
 
 if show_chart:
     st.subheader("📊 Perbandingan Waktu Eksekusi")
-    fig, ax = plt.subplots()
-    ax.bar(["Iteratif", "Rekursif"], [t_iter, t_rec])
-    ax.set_ylabel("Waktu (µs)")
-    ax.set_title(f"Target = {target} kkal")
-    for i, v in enumerate([t_iter, t_rec]):
-        ax.text(i, v * 1.01, f"{v:.2f}", ha="center")
-    st.pyplot(fig, width="stretch")
-    plt.close(fig)
+    st.caption(f"Target = {target} kkal")
+    st.bar_chart(
+        pd.DataFrame({"Waktu (µs)": [t_iter, t_rec]}, index=["Iteratif", "Rekursif"]),
+        y_label="Waktu (µs)",
+    )
 
 st.caption("Catatan: Greedy tidak menjamin solusi optimal global. Closest First memilih menu dengan kalori terdekat terhadap sisa target.")
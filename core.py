@@ -0,0 +1,106 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import List, Tuple
+
+try:
+    from numba import njit
+except ImportError:  # numba opsional: tanpa numba kernel jalan sebagai Python biasa
+    def njit(*args, **kwargs):
+        def wrap(fn):
+            return fn
+        return wrap
+
+# =========================
+# DATA MODEL
+# =========================
+@dataclass(frozen=True, slots=True)
+class Makanan:
+    nama: str
+    kalori: int
+
+# =========================
+# DATA LOADING
+# =========================
+# cache_resource: satu salinan menu + array (read-only) dipakai bersama seluruh sesi
+@st.cache_resource(show_spinner=False)
+def load_menu_from_csv(csv_path: str) -> Tuple[List[Makanan], np.ndarray, np.ndarray, np.ndarray]:
+    df = pd.read_csv(csv_path)
+
+    required_cols = {"Nama_Makanan", "Kalori_kcal"}
+    if not required_cols.issubset(df.columns):
+        raise ValueError(f"Kolom CSV harus ada: {required_cols}. Kolom ditemukan: {set(df.columns)}")
+
+    df["Kalori_kcal"] = pd.to_numeric(df["Kalori_kcal"], errors="coerce")
+    df = df.dropna(subset=["Kalori_kcal", "Nama_Makanan"])
+
+    names = df["Nama_Makanan"].astype(str).to_numpy()
+    kals = df["Kalori_kcal"].astype(np.int64).to_numpy()
+    menu = [Makanan(n, int(k)) for n, k in zip(names, kals)]
+    if not menu:
+        raise ValueError("Data menu kosong setelah validasi. Cek isi CSV kamu.")
+
+    # urut sekali per CSV supaya tiap langkah greedy cukup searchsorted (O(log n));
+    # kalori kembar saling tergantikan, jadi cukup satu wakil (baris pertama) per nilai
+    kal_unik, urutan = np.unique(kals, return_index=True)
+    return menu, kals, kal_unik, urutan.astype(np.int64, copy=False)
+
+# =========================
+# GREEDY: CLOSEST FIRST
+# =========================
+# signature eksplisit: kompilasi eager saat import untuk array int64 C-contiguous
+# ([::1] -> load berurutan/aligned), jadi tidak perlu panggilan pemanasan;
+# nogil supaya kernel bisa jalan paralel di thread lain
+@njit("int64(int64[::1], int64[::1], int64)", cache=True, nogil=True)
+def _pilih_terdekat(kal_sorted: np.ndarray, urutan: np.ndarray, sisa: int) -> int:
+    # posisi (di kal_sorted) menu terdekat ke sisa; seri -> index CSV terkecil, sama seperti min()
+    pos = np.searchsorted(kal_sorted, sisa)
+    if pos == 0:
+        return 0
+    lo = pos - 1  # kal_sorted unik: kandidat bawah langsung tetangga kiri
+    if pos == kal_sorted.size:
+        return lo
+    # jarak sudah non-negatif (kal_sorted[lo] < sisa <= kal_sorted[pos]), jadi tanpa abs;
+    # pilihan bawah/atas dihitung branchless (cmov) karena arahnya tidak bisa ditebak CPU
+    d_lo = sisa - kal_sorted[lo]
+    d_hi = kal_sorted[pos] - sisa
+    pick_lo = (d_lo < d_hi) | ((d_lo == d_hi) & (urutan[lo] < urutan[pos]))
+    return pos + (lo - pos) * pick_lo
+
+@njit("Tuple((int64[::1], int64))(int64, int64[::1], int64[::1])", cache=True, nogil=True)
+def _greedy_core(target: int, kal_sorted: np.ndarray, urutan: np.ndarray) -> Tuple[np.ndarray, int]:
+    out = np.empty(64, np.int64)
+    n_out = 0
+    sisa = target
+
+    while sisa > 0:
+        j = _pilih_terdekat(kal_sorted, urutan, sisa)
+        if n_out == out.size:
+            grow = np.empty(out.size * 2, np.int64)
+            grow[:n_out] = out
+            out = grow
+        out[n_out] = urutan[j]
+        n_out += 1
+        sisa -= kal_sorted[j]
+
+    return out[:n_out], target - sisa
+
+def greedy_iteratif(
+    target: int, menu: List[Makanan], kal_sorted: np.ndarray, urutan: np.ndarray
+) -> Tuple[List[Makanan], int]:
+    idx, total = _greedy_core(target, kal_sorted, urutan)
+    return [menu[i] for i in idx], int(total)
+
+def greedy_rekursif(
+    sisa: int, menu: List[Makanan], kal_sorted: np.ndarray, urutan: np.ndarray, hasil: List[Makanan]
+) -> int:
+    target = sisa
+    # Rekursi ekor greedy_rekursif(sisa - kalori, ...) ditulis ulang sebagai loop
+    # (tail-call elimination): hasil sama, tanpa overhead frame dan tanpa batas rekursi.
+    while sisa > 0:
+        j = _pilih_terdekat(kal_sorted, urutan, sisa)
+        hasil.append(menu[urutan[j]])
+        sisa -= int(kal_sorted[j])
+
+    return target - sisa  # total kalori terpilih